@@ -8,25 +8,32 @@ This program analyzes text files and PDFs (like O'Reilly books) and provides:
 - Key concepts and technical terms extraction
 - Executive summary with actionable insights
 
-Usage: python3 main.py <path_to_book>
+Usage: python3 main.py <path_to_book> [more_books ...]
 Example: python3 main.py books/frankenstein.txt
 Example: python3 main.py oreilly_books/learning_python.pdf
+Example: python3 main.py books/*.txt
 """
 
 # Import the sys module to access command-line arguments
 import sys
 import os
+import hashlib
+import mmap
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 # Import our custom functions from the stats module
 # These functions handle the statistical analysis of the text
-from stats import (
-    get_num_words,           # Function to count words in text
-    chars_dict_to_sorted_list,  # Function to sort character frequency data
-    get_chars_dict,          # Function to count character frequencies
-    extract_key_concepts,     # Function to extract technical terms
-    estimate_reading_time,    # Function to calculate reading time
-    generate_executive_summary, # Function to create executive insights
-)
+from stats import analyze_many  # Function to analyze one or more texts
+
+# Extracted PDF text is cached here, keyed by a hash of the PDF's bytes,
+# so analyzing the same book again skips the slow page-layout extraction
+PDF_CACHE_DIR = Path(os.path.expanduser("~/.cache/bookbot"))
+
+# PDFs with at least this many pages are split across worker processes;
+# below it, starting the workers costs more than it saves
+PARALLEL_PDF_MIN_PAGES = 64
 
 
 def main():
@@ -35,30 +42,32 @@ def main():
     
     This function:
     1. Validates command-line arguments
-    2. Reads the book file
+    2. Reads the book file(s)
     3. Performs statistical analysis
     4. Displays results in a formatted report
     """
     
-    # Check if the user provided exactly one argument (the book file path)
+    # Check if the user provided at least one argument (a book file path)
     # sys.argv is a list: [script_name, argument1, argument2, ...]
     # We need at least 2 items: the script name and the book path
     if len(sys.argv) < 2:
-        print("Usage: python3 main.py <path_to_book>")
+        print("Usage: python3 main.py <path_to_book> [more_books ...]")
         sys.exit(1)  # Exit with error code 1 to indicate failure
     
-    # Get the book file path from the first command-line argument
-    # sys.argv[0] is the script name, sys.argv[1] is our book path
-    book_path = sys.argv[1]
+    # Get the book file paths from the command-line arguments
+    # sys.argv[0] is the script name, sys.argv[1:] are our book paths
+    book_paths = sys.argv[1:]
 
-    # Step 1: Read the entire book file into a string
-    text = get_book_text(book_path)
+    # Step 1: Read each book file into a string
+    texts = [get_book_text(book_path) for book_path in book_paths]
     
     # Step 2: Perform comprehensive analysis
-    analysis_results = analyze_text(text)
+    # Several books are analyzed in parallel, one per CPU core
+    all_results = analyze_many(texts)
     
     # Step 3: Display results in an executive-friendly report
-    print_executive_report(book_path, analysis_results)
+    for book_path, analysis_results in zip(book_paths, all_results):
+        print_executive_report(book_path, analysis_results)
 
 
 def get_book_text(path):
@@ -74,14 +83,23 @@ def get_book_text(path):
     Note:
         Supports both .txt files and .pdf files.
         Uses appropriate extraction method based on file extension.
+        Regular text files are decoded as UTF-8 directly from a memory map,
+        which skips the intermediate read buffer and copy that f.read() makes.
+        Pipes and other special files are read normally.
     """
     file_extension = os.path.splitext(path)[1].lower()
     
     if file_extension == '.pdf':
         return extract_pdf_text(path)
     else:
-        with open(path) as f:
-            return f.read()  # Read the entire file content into memory
+        with open(path, 'rb') as f:
+            # Only a non-empty regular file can be memory-mapped; pipes such
+            # as /dev/stdin report a size of 0 but still have text to read
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                return f.read().decode('utf-8')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return str(mm, 'utf-8')
 
 
 def extract_pdf_text(pdf_path):
@@ -93,50 +111,160 @@ def extract_pdf_text(pdf_path):
         
     Returns:
         str: Extracted text content from all pages
+        
+    Note:
+        PyMuPDF is used when installed; it streams plain text straight out of
+        MuPDF's C engine and is many times faster than pdfplumber, whose
+        layout analysis BookBot does not need. pdfplumber remains the fallback
+        when PyMuPDF is missing or finds no text on any page.
+        
+        Extraction results are cached in PDF_CACHE_DIR under the SHA-1 of the
+        file contents. A renamed or re-copied PDF still hits the cache, while
+        an edited PDF gets a fresh extraction.
     """
     try:
-        import pdfplumber
+        cache_path = PDF_CACHE_DIR / f"{get_file_hash(pdf_path)}.txt"
+        if cache_path.exists():
+            return cache_path.read_text(encoding="utf-8")
         
-        text = ""
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text
-    except ImportError:
-        print("Error: pdfplumber not installed. Run: pip install pdfplumber")
-        sys.exit(1)
+        text = extract_pdf_text_pymupdf(pdf_path)
+        if text is None or not text.strip():
+            fallback_text = extract_pdf_text_pdfplumber(pdf_path)
+            if fallback_text is not None:
+                text = fallback_text
     except Exception as e:
         print(f"Error reading PDF: {e}")
         sys.exit(1)
+    
+    if text is None:
+        print("Error: no PDF library installed. Run: pip install pymupdf")
+        sys.exit(1)
+    
+    # Don't cache an empty result (e.g. a scanned PDF): a PDF library
+    # installed later might still find its text
+    if not text.strip():
+        return text
+    
+    # Caching is best-effort: a read-only home directory should not stop
+    # the analysis
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+    return text
 
 
-def analyze_text(text):
+def extract_pdf_text_pymupdf(pdf_path):
     """
-    Performs comprehensive analysis of text for executive insights.
+    Extracts plain text from every page of a PDF using PyMuPDF.
     
     Args:
-        text (str): The text content to analyze
+        pdf_path (str): Path to the PDF file
         
     Returns:
-        dict: Dictionary containing all analysis results
+        str: Extracted text, or None if PyMuPDF is not installed
+        
+    Note:
+        Large PDFs are split into one contiguous page range per CPU core and
+        extracted in parallel worker processes, since pages decode
+        independently of each other.
     """
-    results = {}
+    try:
+        import pymupdf
+    except ImportError:
+        return None
     
-    # Basic metrics
-    results['word_count'] = get_num_words(text)
-    results['reading_time'] = estimate_reading_time(text)
+    with pymupdf.open(pdf_path) as doc:
+        page_count = doc.page_count
+        workers = min(os.cpu_count() or 1, page_count)
+        if page_count < PARALLEL_PDF_MIN_PAGES or workers < 2:
+            return "\n".join(page.get_text("text") for page in doc)
     
-    # Character analysis (for compatibility)
-    chars_dict = get_chars_dict(text)
-    results['char_analysis'] = chars_dict_to_sorted_list(chars_dict)
+    # Each worker opens its own handle, since MuPDF documents can't be pickled
+    step = -(-page_count // workers)  # Ceiling division
+    jobs = [(pdf_path, start, min(start + step, page_count))
+            for start in range(0, page_count, step)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return "\n".join(executor.map(extract_pdf_pages_pymupdf, jobs))
+
+
+def extract_pdf_pages_pymupdf(job):
+    """
+    Worker for extract_pdf_text_pymupdf: extracts one range of pages.
     
-    # Executive insights
-    results['key_concepts'] = extract_key_concepts(text)
-    results['executive_summary'] = generate_executive_summary(text)
+    Args:
+        job (tuple): (pdf_path, start_page, stop_page), stop exclusive
+        
+    Returns:
+        str: Text of the pages in the range, joined by newlines
+    """
+    import pymupdf
     
-    return results
+    pdf_path, start, stop = job
+    with pymupdf.open(pdf_path) as doc:
+        return "\n".join(doc[i].get_text("text") for i in range(start, stop))
+
+
+def extract_pdf_text_pdfplumber(pdf_path):
+    """
+    Extracts text from every page of a PDF using pdfplumber.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        
+    Returns:
+        str: Extracted text, or None if pdfplumber is not installed
+    """
+    try:
+        import pdfplumber
+    except ImportError:
+        return None
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        # Join once at the end: growing a string with += re-copies
+        # everything extracted so far and is quadratic on long books
+        return "".join(page_text + "\n" for page_text in iter_pdf_pages(pdf))
+
+
+def iter_pdf_pages(pdf):
+    """
+    Yields the text of each page of an open pdfplumber document.
+    
+    Args:
+        pdf (pdfplumber.PDF): An open pdfplumber document
+        
+    Yields:
+        str: Text of each page that contains any
+        
+    Note:
+        Each page's parsed layout objects are released as soon as its text
+        is extracted, so peak memory stays around one page's worth of layout
+        instead of growing with the whole book.
+    """
+    for page in pdf.pages:
+        page_text = page.extract_text()
+        page.flush_cache()
+        if page_text:
+            yield page_text
+
+
+def get_file_hash(path):
+    """
+    Computes the SHA-1 hex digest of a file's contents.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        str: Hex digest used as the PDF cache key
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        # Read in 1 MB blocks so large PDFs are never held in memory twice
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
 
 def print_executive_report(book_path, results):
@@ -145,35 +273,36 @@ def print_executive_report(book_path, results):
     
     Args:
         book_path (str): Path to the analyzed book
-        results (dict): Analysis results from analyze_text()
-    """
-    print("=" * 50)
-    print("📊 EXECUTIVE BOOK ANALYSIS REPORT")
-    print("=" * 50)
-    print(f"📖 File: {book_path}")
-    print(f"📝 Word Count: {results['word_count']:,}")
-    print(f"⏱️  Reading Time: {results['reading_time']}")
-    
-    print("\n" + "=" * 50)
-    print("🎯 EXECUTIVE SUMMARY")
-    print("=" * 50)
+        results (dict): Analysis results from stats.analyze_text()
+        
+    Note:
+        The report is assembled as a list of lines and written with a single
+        sys.stdout.write() call instead of one print() per line.
+    """
+    lines = [
+        "=" * 50,
+        "📊 EXECUTIVE BOOK ANALYSIS REPORT",
+        "=" * 50,
+        f"📖 File: {book_path}",
+        f"📝 Word Count: {results['word_count']:,}",
+        f"⏱️  Reading Time: {results['reading_time']}",
+    ]
+    
+    lines += ["", "=" * 50, "🎯 EXECUTIVE SUMMARY", "=" * 50]
     for insight in results['executive_summary']:
-        print(f"• {insight}")
+        lines.append(f"• {insight}")
     
-    print("\n" + "=" * 50)
-    print("🔑 KEY CONCEPTS & TECHNOLOGIES")
-    print("=" * 50)
+    lines += ["", "=" * 50, "🔑 KEY CONCEPTS & TECHNOLOGIES", "=" * 50]
     for concept in results['key_concepts'][:10]:  # Top 10
-        print(f"• {concept}")
+        lines.append(f"• {concept}")
     
-    print("\n" + "=" * 50)
-    print("📈 CHARACTER FREQUENCY (Top 10)")
-    print("=" * 50)
-    for item in results['char_analysis'][:10]:
-        if item["char"].isalpha():
-            print(f"'{item['char']}': {item['num']:,}")
+    lines += ["", "=" * 50, "📈 CHARACTER FREQUENCY (Top 10)", "=" * 50]
+    for char, num in results['char_analysis'][:10]:
+        if char.isalpha():
+            lines.append(f"'{char}': {num:,}")
     
-    print("=" * 50)
+    lines.append("=" * 50)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_report(book_path, num_words, chars_sorted_list):
@@ -190,18 +319,24 @@ def print_report(book_path, num_words, chars_sorted_list):
     - Header with the file being analyzed
     - Total word count
     - Character frequency analysis (alphabetic characters only)
+    
+    The lines are collected first and written with a single sys.stdout.write()
+    call, which is much cheaper than one print() per character when output
+    is piped or redirected.
     """
     
-    # Print a nice header for the report
-    print("============ BOOKBOT ============")
-    print(f"Analyzing book found at {book_path}...")
+    # Build a nice header for the report
+    lines = [
+        "============ BOOKBOT ============",
+        f"Analyzing book found at {book_path}...",
+    ]
     
-    # Display word count section
-    print("----------- Word Count ----------")
-    print(f"Found {num_words} total words")
+    # Word count section
+    lines.append("----------- Word Count ----------")
+    lines.append(f"Found {num_words} total words")
     
-    # Display character frequency section
-    print("--------- Character Count -------")
+    # Character frequency section
+    lines.append("--------- Character Count -------")
     
     # Loop through each character and its count
     # chars_sorted_list contains dictionaries like: {"char": "e", "num": 12345}
@@ -210,11 +345,14 @@ def print_report(book_path, num_words, chars_sorted_list):
         if not item["char"].isalpha():
             continue  # Skip this iteration and go to the next character
         
-        # Print the character and how many times it appeared
-        print(f"{item['char']}: {item['num']}")
+        # Add the character and how many times it appeared
+        lines.append(f"{item['char']}: {item['num']}")
 
-    # Print closing footer
-    print("============= END ===============")
+    # Closing footer
+    lines.append("============= END ===============")
+    
+    # Write the whole report at once
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # This is a Python idiom that ensures main() only runs when this script
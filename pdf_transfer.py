@@ -13,110 +13,277 @@ Usage:
 """
 
 import os
-import shutil
+import sys
+import glob
+import json
+import time
 import argparse
 from pathlib import Path
 
+# shutil and concurrent.futures are imported inside the copy functions that
+# use them: --list never needs them, and concurrent.futures alone pulls in
+# logging and threading, a noticeable share of this tool's startup time
+
 # Windows Desktop path through WSL
 WINDOWS_DESKTOP = "/mnt/c/Users/*/Desktop"
 LOCAL_PDF_DIR = "pdfs"
 
+# Scanning /mnt/c is slow, so the list of found PDFs is cached here and
+# reused for PDF_LIST_CACHE_TTL seconds unless a Desktop folder changes
+PDF_LIST_CACHE = Path(os.path.expanduser("~/.cache/bookbot/pdflist.json"))
+PDF_LIST_CACHE_TTL = 300
+
+# Base patterns for different OneDrive configurations
+DESKTOP_BASE_PATTERNS = (
+    "/mnt/c/Users/*/Desktop",
+    "/mnt/c/Users/*/OneDrive/Desktop",
+    "/mnt/c/Users/*/OneDrive - */Desktop",
+    # Additional common patterns
+    "/mnt/c/Users/*/Documents/Desktop",
+    "/mnt/c/Users/*/Desktop - Shortcut",
+)
+
+# Subdirectory patterns within desktop locations
+DESKTOP_SUBDIRS = ("", "/Library", "/library", "/Books", "/books", "/PDFs", "/pdfs", "/Documents")
+
+# Every base/subdirectory combination, built once at import
+DESKTOP_PATTERNS = tuple(base + subdir
+                         for base in DESKTOP_BASE_PATTERNS
+                         for subdir in DESKTOP_SUBDIRS)
+
 def get_windows_desktop_paths():
     """
     Finds all possible Windows Desktop paths in WSL environment.
     
     Returns:
-        list: List of all valid desktop paths found
-    """
-    import glob
-    import os
-    
-    # Get actual username from environment or system
-    username = os.environ.get('USER', '*')
-    
-    # Base patterns for different OneDrive configurations
-    base_patterns = [
-        f"/mnt/c/Users/{username}/Desktop",
-        f"/mnt/c/Users/{username}/OneDrive/Desktop", 
-        f"/mnt/c/Users/{username}/OneDrive - */Desktop",
-        "/mnt/c/Users/*/Desktop",
-        "/mnt/c/Users/*/OneDrive/Desktop",
-        "/mnt/c/Users/*/OneDrive - */Desktop",
-        # Additional common patterns
-        "/mnt/c/Users/*/Documents/Desktop",
-        "/mnt/c/Users/*/Desktop - Shortcut",
-    ]
-    
-    # Subdirectory patterns within desktop locations
-    subdirs = ["", "/Library", "/library", "/Books", "/books", "/PDFs", "/pdfs", "/Documents"]
-    
-    # Generate all combinations
-    all_patterns = []
-    for base in base_patterns:
-        for subdir in subdirs:
-            all_patterns.append(base + subdir)
-    
+        list: List of all valid desktop paths found, with the current
+              user's folders first
+    """
     # Find all existing paths
     valid_paths = []
-    for pattern in all_patterns:
+    seen = set()
+    for pattern in DESKTOP_PATTERNS:
         try:
             matches = glob.glob(pattern)
             for match in matches:
-                if os.path.isdir(match) and match not in valid_paths:
+                if match not in seen and os.path.isdir(match):
+                    seen.add(match)
                     valid_paths.append(match)
         except Exception:
             continue  # Skip invalid patterns
     
+    # Get actual username from environment or system. Its folders are
+    # already among the matches above; a stable sort just moves them first.
+    username = os.environ.get('USER')
+    if username:
+        user_prefix = f"/mnt/c/Users/{username}/"
+        valid_paths.sort(key=lambda path: not path.startswith(user_prefix))
+    
     return valid_paths
 
-def list_pdfs():
+def list_pdfs(refresh=False):
     """
     Lists all PDF files found across all Windows Desktop locations.
     
+    Args:
+        refresh (bool): Rescan the Desktop even if a fresh cached list exists
+    
     Returns:
         list: List of PDF file paths with source directory info
     """
     desktop_paths = get_windows_desktop_paths()
     if not desktop_paths:
-        print("❌ No Windows Desktop locations found in WSL environment")
-        print("💡 Searched common paths like:")
-        print("   /mnt/c/Users/*/Desktop")
-        print("   /mnt/c/Users/*/OneDrive/Desktop") 
-        print("   /mnt/c/Users/*/OneDrive - */Desktop")
+        print_no_desktop_hint()
         return []
     
-    all_pdf_files = []
+    if not refresh:
+        cached = load_cached_pdf_list(desktop_paths)
+        if cached is not None:
+            found_locations, unique_pdfs = cached
+            print_found_locations(found_locations)
+            return unique_pdfs
+    
+    all_pdf_entries = []
     found_locations = []
     
     for desktop_path in desktop_paths:
-        desktop = Path(desktop_path)
-        if desktop.exists():
-            # Find PDFs in this location
-            pdf_files = list(desktop.glob("*.pdf"))
-            pdf_files.extend(list(desktop.glob("**/*.pdf")))  # Include subdirectories
-            
-            if pdf_files:
-                found_locations.append(f"📁 {desktop_path} ({len(pdf_files)} PDFs)")
-                all_pdf_files.extend(pdf_files)
+        # Find PDFs in this location, including subdirectories
+        pdf_entries = list(walk_pdfs(desktop_path))
+        
+        if pdf_entries:
+            found_locations.append(f"📁 {desktop_path} ({len(pdf_entries)} PDFs)")
+            all_pdf_entries.extend(pdf_entries)
     
     # Print summary of locations searched
-    if found_locations:
-        print("🔍 Found PDFs in:")
-        for location in found_locations:
-            print(f"   {location}")
-        print()
+    print_found_locations(found_locations)
     
     # Remove duplicates while preserving order
     seen = set()
     unique_pdfs = []
-    for pdf in all_pdf_files:
-        pdf_key = (pdf.name, pdf.stat().st_size)  # Use name + size as unique key
+    for entry in all_pdf_entries:
+        pdf_key = (entry.name, entry.stat().st_size)  # Use name + size as unique key
         if pdf_key not in seen:
             seen.add(pdf_key)
-            unique_pdfs.append(pdf)
+            unique_pdfs.append(Path(entry.path))
     
+    save_cached_pdf_list(desktop_paths, found_locations, unique_pdfs)
     return unique_pdfs
 
+def find_pdf(name, refresh=False):
+    """
+    Finds the first Desktop PDF whose file name contains the given text.
+    
+    Unlike list_pdfs(), this walks the Desktop folders lazily and stops at
+    the first match, so a book in a shallow folder is found without
+    enumerating every other PDF. A fresh cached PDF list is searched
+    first when one exists; if it has no match, the folders are still walked.
+    
+    Args:
+        name (str): Text to look for in the file name (case-insensitive)
+        refresh (bool): Ignore the cached PDF list
+        
+    Returns:
+        Path: The matching PDF, or None if nothing matches
+    """
+    wanted = name.lower()
+    desktop_paths = get_windows_desktop_paths()
+    if not desktop_paths:
+        print_no_desktop_hint()
+        return None
+    
+    if not refresh:
+        # The cache only notices changes directly inside each Desktop folder,
+        # so trust it for a hit but walk the folders on a miss: the PDF may
+        # have been added to a subfolder since the list was cached
+        cached = load_cached_pdf_list(desktop_paths)
+        if cached is not None:
+            _, pdfs = cached
+            # Only the match is checked, in case it was deleted since the scan
+            match = next((pdf for pdf in pdfs
+                          if wanted in pdf.name.lower() and pdf.exists()), None)
+            if match is not None:
+                return match
+    
+    for desktop_path in desktop_paths:
+        for entry in walk_pdfs(desktop_path):
+            if wanted in entry.name.lower():
+                return Path(entry.path)
+    return None
+
+
+def print_no_desktop_hint():
+    """Explains where we looked when no Windows Desktop folder was found."""
+    print("❌ No Windows Desktop locations found in WSL environment")
+    print("💡 Searched common paths like:")
+    print("   /mnt/c/Users/*/Desktop")
+    print("   /mnt/c/Users/*/OneDrive/Desktop") 
+    print("   /mnt/c/Users/*/OneDrive - */Desktop")
+
+
+def walk_pdfs(root):
+    """
+    Recursively finds PDF files under a directory.
+    
+    Uses a single os.scandir() walk instead of pathlib globbing: directory
+    entries already know whether they are folders, and each DirEntry caches
+    its stat() result, which saves many slow /mnt/c round-trips in WSL.
+    
+    A folder's own PDFs are yielded before anything in its subfolders, so
+    Desktop/python.pdf comes before Desktop/Books/old/python.pdf and
+    find_pdf() prefers the shallower match.
+    
+    Args:
+        root (str): Directory to search
+        
+    Yields:
+        os.DirEntry: One entry per PDF file (extension matched case-insensitively)
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(".pdf"):
+                    yield entry
+    except OSError:
+        return  # Skip folders we can't read
+    
+    # Only descend once this folder's own PDFs have been yielded
+    for subdir in subdirs:
+        yield from walk_pdfs(subdir)
+
+
+def print_found_locations(found_locations):
+    """
+    Prints the summary of Desktop folders that contained PDFs.
+    
+    Args:
+        found_locations (list): Summary lines built by list_pdfs()
+    """
+    if found_locations:
+        print("🔍 Found PDFs in:")
+        for location in found_locations:
+            print(f"   {location}")
+        print()
+
+def load_cached_pdf_list(desktop_paths):
+    """
+    Loads the cached PDF list if it is still valid.
+    
+    The cache is valid when it was built from the same Desktop folders, is
+    younger than PDF_LIST_CACHE_TTL, and none of those folders has been
+    modified since it was written. Only the Desktop folders themselves are
+    checked, so PDFs added to or removed from a subfolder show up once the
+    cache expires (or with --refresh).
+    
+    Args:
+        desktop_paths (list): Desktop folders found by get_windows_desktop_paths()
+        
+    Returns:
+        tuple: (found_locations, pdf_paths), or None if the cache is missing or stale
+    """
+    try:
+        cache_mtime = PDF_LIST_CACHE.stat().st_mtime
+        if time.time() - cache_mtime > PDF_LIST_CACHE_TTL:
+            return None
+        if max(os.stat(path).st_mtime for path in desktop_paths) > cache_mtime:
+            return None
+        with PDF_LIST_CACHE.open() as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cache.get("desktop_paths") != desktop_paths:
+        return None
+    
+    # Entries aren't re-checked here: a stat() per PDF over /mnt/c is the
+    # cost the cache exists to avoid. A PDF deleted from a subfolder since
+    # the scan can still be listed until the cache expires.
+    return cache["locations"], [Path(pdf) for pdf in cache["pdfs"]]
+
+def save_cached_pdf_list(desktop_paths, found_locations, pdfs):
+    """
+    Writes the PDF list to PDF_LIST_CACHE for later invocations.
+    
+    Args:
+        desktop_paths (list): Desktop folders that were scanned
+        found_locations (list): Summary lines built by list_pdfs()
+        pdfs (list): Unique PDF paths that were found
+    """
+    cache = {
+        "desktop_paths": desktop_paths,
+        "locations": found_locations,
+        "pdfs": [str(pdf) for pdf in pdfs],
+    }
+    # Caching is best-effort; a failed write just means the next run rescans
+    try:
+        PDF_LIST_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with PDF_LIST_CACHE.open("w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
 def copy_pdf(pdf_path, destination_dir="pdfs"):
     """
     Copies a PDF file to the local directory.
@@ -136,7 +303,7 @@ def copy_pdf(pdf_path, destination_dir="pdfs"):
         destination = Path(destination_dir) / pdf_path.name
         
         # Copy the file
-        shutil.copy2(pdf_path, destination)
+        copy_file_fast(pdf_path, destination)
         print(f"✅ Copied: {pdf_path.name} -> {destination}")
         
         return str(destination)
@@ -145,6 +312,101 @@ def copy_pdf(pdf_path, destination_dir="pdfs"):
         print(f"❌ Error copying {pdf_path}: {e}")
         return None
 
+def copy_file_fast(src, dst):
+    """
+    Copies a file's contents and metadata, keeping the bytes in the kernel.
+    
+    os.copy_file_range() moves data between the two files without passing it
+    through Python, which matters for large PDFs coming off /mnt/c in WSL.
+    Falls back to shutil.copy2() on platforms or filesystems that don't
+    support it.
+    
+    Args:
+        src (Path): Source file
+        dst (Path): Destination file
+    """
+    import shutil
+    
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+    
+    # Opening dst for writing would truncate src if they are the same file
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+    
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            # Hint the kernel to read ahead aggressively
+            os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    raise OSError("copy_file_range stopped early")
+                remaining -= copied
+    except OSError:
+        # e.g. EXDEV or ENOSYS on older kernels: copy the usual way
+        shutil.copy2(src, dst)
+        return
+    
+    shutil.copystat(src, dst)
+
+def copy_pdfs_parallel(pdfs, max_workers=8):
+    """
+    Copies many PDFs to the local directory using a pool of threads.
+    
+    Copies from /mnt/c spend most of their time waiting on the Windows side,
+    so several copies in flight overlap that waiting. Threads (rather than
+    processes) are enough because the GIL is released during file I/O.
+    
+    Args:
+        pdfs (list): Source PDF paths
+        max_workers (int): Maximum number of copies in flight
+        
+    Returns:
+        int: Number of PDFs copied successfully
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Different PDFs can share a file name (same name, different size).
+    # Copy those one after another in a single task so two threads never
+    # write the same destination file at once.
+    same_name_groups = {}
+    for pdf in pdfs:
+        same_name_groups.setdefault(pdf.name, []).append(pdf)
+    
+    def copy_group(group):
+        return sum(1 for pdf in group if copy_pdf(pdf))
+    
+    workers = min(max_workers, len(same_name_groups))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(copy_group, same_name_groups.values()))
+
+def run_analysis(pdf_path):
+    """
+    Replaces this process with BookBot's analysis of the given PDF.
+    
+    os.execv() runs main.py in the current process instead of starting a
+    shell and then a second Python. The path is passed as a separate
+    argument, so file names with quotes or other shell characters are safe.
+    Does not return.
+    
+    Args:
+        pdf_path (str): PDF to analyze
+    """
+    # exec discards anything still sitting in Python's output buffer
+    sys.stdout.flush()
+    if "__compiled__" in globals():
+        # Built with Nuitka: sys.executable is this binary rather than Python,
+        # and __file__ points into its unpack directory, not the repository
+        script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+        main_script = os.path.join(script_dir, "main.py")
+        os.execvp("python3", ["python3", main_script, pdf_path])
+    
+    main_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    os.execv(sys.executable, [sys.executable, main_script, pdf_path])
+
 def main():
     parser = argparse.ArgumentParser(description="PDF Transfer Utility for BookBot")
     parser.add_argument("--list", action="store_true", help="List available PDFs on Desktop")
@@ -152,6 +414,7 @@ def main():
     parser.add_argument("--copy-all", action="store_true", help="Copy all PDFs from Desktop")
     parser.add_argument("--analyze", type=str, help="Copy and analyze specific PDF")
     parser.add_argument("--desktop-path", type=str, help="Override Windows Desktop path")
+    parser.add_argument("--refresh", action="store_true", help="Rescan Desktop instead of using the cached PDF list")
     
     args = parser.parse_args()
     
@@ -166,7 +429,7 @@ def main():
     
     if args.list:
         print("🔍 Scanning Windows Desktop for PDFs...")
-        pdfs = list_pdfs()
+        pdfs = list_pdfs(refresh=args.refresh)
         
         if pdfs:
             print(f"\n📚 Found {len(pdfs)} PDF(s):")
@@ -178,14 +441,7 @@ def main():
     
     elif args.copy:
         print(f"📋 Looking for PDF: {args.copy}")
-        pdfs = list_pdfs()
-        
-        # Find matching PDF (case-insensitive)
-        matching_pdf = None
-        for pdf in pdfs:
-            if args.copy.lower() in pdf.name.lower():
-                matching_pdf = pdf
-                break
+        matching_pdf = find_pdf(args.copy, refresh=args.refresh)
         
         if matching_pdf:
             copied_path = copy_pdf(matching_pdf)
@@ -197,13 +453,11 @@ def main():
     
     elif args.copy_all:
         print("📋 Copying all PDFs from Desktop...")
-        pdfs = list_pdfs()
+        # Always rescan so a bulk copy never misses a newly added PDF
+        pdfs = list_pdfs(refresh=True)
         
         if pdfs:
-            copied_count = 0
-            for pdf in pdfs:
-                if copy_pdf(pdf):
-                    copied_count += 1
+            copied_count = copy_pdfs_parallel(pdfs)
             
             print(f"\n✅ Successfully copied {copied_count}/{len(pdfs)} PDFs")
             print(f"📁 PDFs are now in the '{LOCAL_PDF_DIR}' directory")
@@ -212,21 +466,13 @@ def main():
     
     elif args.analyze:
         print(f"📋 Copying and analyzing: {args.analyze}")
-        pdfs = list_pdfs()
-        
-        # Find matching PDF
-        matching_pdf = None
-        for pdf in pdfs:
-            if args.analyze.lower() in pdf.name.lower():
-                matching_pdf = pdf
-                break
+        matching_pdf = find_pdf(args.analyze, refresh=args.refresh)
         
         if matching_pdf:
             copied_path = copy_pdf(matching_pdf)
             if copied_path:
                 print(f"\n🚀 Running analysis...")
-                # Use quotes to handle spaces in filename
-                os.system(f'python3 main.py "{copied_path}"')
+                run_analysis(copied_path)
         else:
             print(f"❌ PDF '{args.analyze}' not found on Desktop")
     
@@ -7,15 +7,190 @@ and technical concept extraction.
 
 Functions:
 - get_num_words: Counts total words in a text
-- get_chars_dict: Creates character frequency dictionary  
+- get_chars_dict: Creates letter frequency dictionary  
+- count_words_and_letters: Word count and letter frequencies in one go
 - chars_dict_to_sorted_list: Converts and sorts character data
+- chars_dict_to_sorted_pairs: Sorts character data as (char, count) pairs
 - sort_on: Helper function for sorting by frequency
 - extract_key_concepts: Identifies technical terms and concepts
 - estimate_reading_time: Calculates reading time estimates
 - generate_executive_summary: Creates actionable insights
+- analyze_text: Runs every analysis above on one text
+- analyze_many: Runs analyze_text on several texts in parallel
 """
 
+import functools
+import hashlib
+import heapq
+import os
 import re
+import string
+from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+# NumPy is optional: when it is installed, letter and word counting use
+# vectorized byte operations instead of str/bytes method calls
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The public functions (what "from stats import *" brings in)
+__all__ = [
+    'get_num_words',
+    'get_chars_dict',
+    'count_words_and_letters',
+    'chars_dict_to_sorted_list',
+    'chars_dict_to_sorted_pairs',
+    'sort_on',
+    'extract_key_concepts',
+    'estimate_reading_time',
+    'detect_technical_content',
+    'generate_executive_summary',
+    'analyze_text',
+    'analyze_many',
+]
+
+# Every ASCII byte, for deleting them with bytes.translate()
+_ASCII_BYTES = bytes(range(128))
+
+if np is not None:
+    # Lookup table of the ASCII bytes that str.split() treats as whitespace
+    _ASCII_WHITESPACE = np.array([chr(i).isspace() for i in range(128)], dtype=bool)
+
+# How many distinct texts each memoized function remembers
+_MEMO_SIZE = 32
+
+# analyze_many() only starts worker processes for at least this many texts
+# and this many characters in total; below that, startup costs more than
+# the parallel work saves
+_PARALLEL_MIN_TEXTS = 3
+_PARALLEL_MIN_CHARS = 1_000_000
+
+# The term lists below are built once at import instead of on every call.
+
+# ENHANCED CONCEPT: Weighted technical indicators for
+# detect_technical_content(), grouped as (weight, terms)
+_TECHNICAL_INDICATORS = (
+    # High-weight: Very technical terms
+    (3, ('algorithm', 'architecture', 'scalability', 'optimization',
+         'implementation', 'performance', 'security', 'protocol')),
+    
+    # Medium-weight: Programming and system terms
+    (2, ('api', 'framework', 'library', 'database', 'server',
+         'function', 'method', 'class', 'object', 'variable',
+         'coding', 'programming', 'development', 'software')),
+    
+    # Lower-weight: Common tech terms
+    (1, ('system', 'network', 'service', 'platform', 'application')),
+)
+
+# Programming languages (high weight)
+_PROGRAMMING_LANGUAGES = (
+    'python', 'java', 'javascript', 'go', 'rust', 'sql', 'html', 'css'
+)
+_PROGRAMMING_LANGUAGE_WEIGHT = 3
+
+# Every (weight, term) pair above, heaviest first, so
+# detect_technical_content() can stop as soon as the threshold is reached
+_WEIGHTED_TECHNICAL_TERMS = sorted(
+    [(weight, term) for weight, terms in _TECHNICAL_INDICATORS for term in terms]
+    + [(_PROGRAMMING_LANGUAGE_WEIGHT, lang) for lang in _PROGRAMMING_LANGUAGES],
+    key=lambda pair: pair[0],
+    reverse=True,
+)
+
+# Specific technical terms extract_key_concepts() looks for (curated list)
+_KNOWN_TECHNICAL_TERMS = frozenset({
+    # System Design
+    'load balancer', 'microservice', 'monolith', 'api gateway', 'service mesh',
+    'caching', 'sharding', 'replication', 'consistency', 'availability',
+    'cap theorem', 'horizontal scaling', 'vertical scaling',
+    
+    # Databases
+    'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch', 'dynamodb',
+    'cassandra', 'neo4j', 'rdbms', 'nosql', 'acid', 'sql',
+    
+    # Cloud & Infrastructure
+    'aws', 'azure', 'gcp', 'kubernetes', 'docker', 'cloudfront', 'lambda',
+    'ec2', 's3', 'rds', 'vpc', 'cdn',
+    
+    # Programming & Frameworks
+    'python', 'java', 'javascript', 'typescript', 'go', 'rust',
+    'react', 'angular', 'vue', 'spring', 'django', 'flask', 'express',
+    
+    # Protocols & APIs
+    'http', 'https', 'tcp', 'udp', 'websocket', 'grpc', 'graphql',
+    'rest', 'api', 'json', 'xml', 'oauth', 'jwt',
+    
+    # Architecture Patterns
+    'microservices', 'event driven', 'message queue', 'pub sub',
+    'circuit breaker', 'bulkhead', 'saga pattern'
+})
+
+# Known terms written in all caps ("API") or with their own mixed case
+# ("gRPC") instead of title case when reported as concepts
+_ACRONYM_TERMS = frozenset({
+    'api', 'http', 'https', 'tcp', 'udp', 'sql', 'json', 'xml', 'jwt',
+    'aws', 'gcp', 'cdn', 'vpc', 'rds', 'ec2', 's3'
+})
+_MIXED_CASE_TERMS = {'nosql': 'NoSQL', 'grpc': 'gRPC', 'graphql': 'GraphQL'}
+
+# Terms extract_key_concepts() should absolutely exclude
+_CONCEPT_EXCLUSIONS = frozenset({
+    'afterword', 'chapter', 'section', 'figure', 'table', 'page',
+    'introduction', 'conclusion', 'summary', 'appendix', 'index',
+    'users', 'user', 'data', 'system', 'service', 'web', 'store', 'drive',
+    'file', 'time', 'way', 'example', 'problem', 'solution', 'method',
+    'information', 'result', 'process', 'work', 'team', 'company'
+})
+
+# Deletes the characters that only vary between spellings of the same
+# concept ("Node.js" vs "nodejs", "event driven" vs "event-driven")
+_KEY_TRANS = str.maketrans('', '', ' .-')
+
+# Phrases generate_executive_summary() looks for to flag practical
+# content and strategic (best practice / architecture) content
+_EXAMPLE_PHRASES = ('example', 'tutorial', 'how to', 'step by step')
+_BEST_PRACTICE_PHRASES = ('best practice', 'pattern', 'architecture')
+
+# Reading speeds in words per minute, as (fast, slow)
+# Technical content requires careful reading: a quick scan for familiar
+# concepts vs careful study with note-taking
+_TECHNICAL_READING_SPEEDS = (250, 150)
+# General content allows faster reading: executive skimming vs thorough reading
+_GENERAL_READING_SPEEDS = (350, 200)
+
+# Technology/product names with distinctive capitalization
+_TECH_NAME_RE = re.compile(r'\b(?:MongoDB|PostgreSQL|MySQL|Redis|Elasticsearch|DynamoDB|Cassandra|Neo4j|CloudFront|WebSocket|JavaScript|TypeScript|Node\.js|Next\.js|Spring Boot|React Native)\b')
+
+
+def _memoize_by_text(func):
+    """
+    Decorator that caches func(text) results, keyed by a digest of the text.
+    
+    Hashing a book with BLAKE2b is far cheaper than re-running the term
+    scans, and a 16-byte digest keeps the cache keys small no matter how big
+    the text is. Results are shared between callers, so func should return
+    something immutable (like a tuple).
+    """
+    cache = OrderedDict()
+    
+    @functools.wraps(func)
+    def wrapper(text):
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = func(text)
+            if len(cache) > _MEMO_SIZE:
+                cache.popitem(last=False)  # Forget the least recently used text
+        else:
+            cache.move_to_end(key)
+        return result
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
 
 
 def get_num_words(text):
@@ -29,14 +204,20 @@ def get_num_words(text):
         int: The total number of words found
         
     How it works:
-    1. Uses the split() method to break text into a list of words
-    2. split() automatically handles multiple spaces, tabs, and newlines
-    3. Returns the length of the resulting list
+    1. For plain ASCII text with NumPy installed, marks every whitespace byte
+       and counts the positions where a word begins (a non-whitespace byte at
+       the start of the text or right after whitespace). No word list is built.
+    2. Otherwise, uses the split() method to break text into a list of words
+       (split() automatically handles multiple spaces, tabs, and newlines)
+       and returns the length of the resulting list
     
     Example:
         >>> get_num_words("Hello world! How are you?")
         5
     """
+    if text and text.isascii() and np is not None:
+        return _count_ascii_words(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+    
     # Split the text into words using whitespace as delimiters
     # This creates a list where each element is a word
     words = text.split()
@@ -47,38 +228,116 @@ def get_num_words(text):
 
 def get_chars_dict(text):
     """
-    Creates a dictionary that counts how many times each character appears in the text.
+    Creates a dictionary that counts how many times each letter appears in the text.
     
     Args:
         text (str): The text to analyze
         
     Returns:
-        dict: A dictionary where keys are characters (lowercase) and values are counts
+        dict: A dictionary where keys are letters (lowercase) and values are counts.
+              Digits, whitespace and punctuation are not counted.
         
     How it works:
-    1. Iterates through every character in the text
-    2. Converts each character to lowercase for consistent counting
-    3. Increments the count for each character in the dictionary
+    1. Encodes the text as UTF-8. ASCII letters are single bytes there, and
+       every byte of an accented or non-Latin character is 128 or above, so
+       the 26 ASCII letters can be counted directly on the bytes:
+       - with NumPy installed, a histogram of all bytes via np.bincount,
+         adding each uppercase count to its lowercase letter
+       - otherwise, the bytes are lowercased once and bytes.count() is asked
+         for each of the 26 letters (26 fast C-level scans instead of one
+         Python-level loop over every character)
+    2. If the text has non-ASCII characters, deletes every ASCII byte with
+       bytes.translate() and counts what is left with collections.Counter,
+       folding uppercase into lowercase and keeping only alphabetic
+       characters. Counter only ever sees the small non-ASCII fraction.
     
     Example:
         >>> get_chars_dict("Hello")
-        {'h': 1, 'e': 1, 'l': 2, 'o': 1}
+        {'e': 1, 'h': 1, 'l': 2, 'o': 1}
     """
-    # Initialize an empty dictionary to store character counts
-    chars = {}
+    encoded = text.encode('utf-8', 'surrogatepass')
+    buf = np.frombuffer(encoded, dtype=np.uint8) if np is not None else None
+    return _count_letters(text, encoded, buf)
+
+
+def count_words_and_letters(text):
+    """
+    Computes get_num_words(text) and get_chars_dict(text) in one go.
     
-    # Loop through every single character in the text
-    for c in text:
-        # Convert character to lowercase so 'A' and 'a' are counted together
-        lowered = c.lower()
+    Args:
+        text (str): The text to analyze
         
-        # Check if we've seen this character before
-        if lowered in chars:
-            # If yes, increment its count by 1
-            chars[lowered] += 1
-        else:
-            # If no, add it to the dictionary with a count of 1
-            chars[lowered] = 1
+    Returns:
+        tuple: (word count, letter frequency dictionary)
+        
+    With NumPy installed, the text is encoded and wrapped as a byte array only
+    once, and both the whitespace mask for the word count and the letter
+    histogram are computed from that same array while it is still in cache.
+    """
+    if np is None or not text:
+        return get_num_words(text), get_chars_dict(text)
+    
+    encoded = text.encode('utf-8', 'surrogatepass')
+    buf = np.frombuffer(encoded, dtype=np.uint8)
+    if text.isascii():
+        word_count = _count_ascii_words(buf)
+    else:
+        # Non-ASCII whitespace (e.g. no-break spaces) spans several bytes
+        word_count = len(text.split())
+    return word_count, _count_letters(text, encoded, buf)
+
+
+def _count_ascii_words(buf):
+    """
+    Counts words in non-empty ASCII text given as a NumPy uint8 array.
+    
+    Marks every whitespace byte and counts the positions where a word begins:
+    a non-whitespace byte at the very start or right after whitespace.
+    """
+    is_space = _ASCII_WHITESPACE[buf]
+    word_starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+    return int(word_starts) + (0 if is_space[0] else 1)
+
+
+def _count_letters(text, encoded, buf):
+    """
+    Does the work of get_chars_dict() on already-encoded text.
+    
+    Args:
+        text (str): The original text
+        encoded (bytes): The text encoded as UTF-8
+        buf (numpy.ndarray): encoded viewed as uint8, or None without NumPy
+        
+    Returns:
+        dict: Lowercase letters mapped to their counts
+    """
+    # Initialize an empty dictionary to store letter counts
+    chars = {}
+    
+    if buf is not None:
+        # One vectorized pass over the bytes; 'A' (65) sits exactly 32 slots
+        # below 'a' (97), so case folding is a single addition per letter
+        counts = np.bincount(buf, minlength=128)
+        for letter in string.ascii_lowercase:
+            num = int(counts[ord(letter)] + counts[ord(letter) - 32])
+            if num:
+                chars[letter] = num
+    else:
+        # bytes.lower() only changes ASCII letters
+        lowered = encoded.lower()
+        for letter in string.ascii_lowercase:
+            num = lowered.count(ord(letter))
+            if num:
+                chars[letter] = num
+    
+    if not text.isascii():
+        # Count the remaining distinct characters, then merge uppercase into
+        # lowercase (some, like the Kelvin sign, lowercase to an ASCII letter)
+        rest = encoded.translate(None, _ASCII_BYTES).decode('utf-8', 'surrogatepass')
+        for c, num in Counter(rest).items():
+            lowered = c.lower()
+            if lowered.isalpha():
+                chars[lowered] = chars.get(lowered, 0) + num
     
     # Return the completed dictionary
     return chars
@@ -101,45 +360,56 @@ def sort_on(d):
     return d["num"]
 
 
-def chars_dict_to_sorted_list(num_chars_dict):
+def chars_dict_to_sorted_list(num_chars_dict, limit=None):
     """
     Converts a character frequency dictionary to a sorted list of dictionaries.
     
     Args:
         num_chars_dict (dict): Dictionary with characters as keys and counts as values
+        limit (int, optional): Only return the `limit` most frequent characters
         
     Returns:
         list: List of dictionaries, each containing "char" and "num" keys,
               sorted by frequency (highest count first)
               
     How it works:
-    1. Creates an empty list to store the results
-    2. Converts each dictionary entry to a new format: {"char": "a", "num": 123}
-    3. Sorts the list by frequency count (highest first)
+    1. Sorts the (char, count) pairs with chars_dict_to_sorted_pairs()
+    2. Converts each pair to the dictionary format: {"char": "a", "num": 123}
     
     Example:
         Input:  {'a': 5, 'b': 2, 'c': 8}
         Output: [{"char": "c", "num": 8}, {"char": "a", "num": 5}, {"char": "b", "num": 2}]
     """
-    # Create an empty list to hold our converted data
-    sorted_list = []
+    return [{"char": ch, "num": num}
+            for ch, num in chars_dict_to_sorted_pairs(num_chars_dict, limit)]
+
+
+def chars_dict_to_sorted_pairs(num_chars_dict, limit=None):
+    """
+    Sorts a character frequency dictionary into (char, count) pairs.
     
-    # Loop through each character and its count in the dictionary
-    for ch in num_chars_dict:
-        # Create a new dictionary with a standardized format
-        # This makes it easier to work with in other parts of the program
-        char_data = {"char": ch, "num": num_chars_dict[ch]}
+    Args:
+        num_chars_dict (dict): Dictionary with characters as keys and counts as values
+        limit (int, optional): Only return the `limit` most frequent characters
         
-        # Add this dictionary to our list
-        sorted_list.append(char_data)
-    
-    # Sort the list by the "num" value in descending order (highest first)
-    # reverse=True means highest numbers come first
-    # key=sort_on tells Python to use our sort_on function to determine sort order
-    sorted_list.sort(reverse=True, key=sort_on)
+    Returns:
+        list: (char, count) tuples sorted by count (highest first); characters
+              with equal counts keep their dictionary order
+              
+    This is the cheap form for code that just loops over the results: the
+    dict's own items are sorted directly, with no intermediate dictionary
+    per character. With a limit, heapq.nlargest() picks the top entries
+    instead of sorting them all.
     
-    # Return the sorted list
-    return sorted_list
+    Example:
+        Input:  {'a': 5, 'b': 2, 'c': 8}
+        Output: [('c', 8), ('a', 5), ('b', 2)]
+    """
+    # itemgetter(1) reads the count from each pair in C, without a Python
+    # function call per comparison
+    if limit is not None:
+        return heapq.nlargest(limit, num_chars_dict.items(), key=itemgetter(1))
+    return sorted(num_chars_dict.items(), key=itemgetter(1), reverse=True)
 
 
 def estimate_reading_time(text):
@@ -152,40 +422,39 @@ def estimate_reading_time(text):
     Returns:
         str: Formatted reading time range (e.g., "2h 30m - 4h 15m")
     """
-    word_count = get_num_words(text)
-    
+    # Only the word count and the technical check are needed here, so skip
+    # the full _analyze() scan (key concepts etc.) that analyze_text() runs
+    return _reading_time(get_num_words(text), detect_technical_content(text))
+
+
+def _reading_time(word_count, is_technical):
+    """estimate_reading_time() for an already known word count and technical flag."""
     # Reading speed ranges for different scenarios
-    if detect_technical_content(text):
-        # Technical content: requires careful reading
-        fast_speed = 250    # Quick scan for familiar concepts  
-        slow_speed = 150    # Careful study with note-taking
+    if is_technical:
+        fast_speed, slow_speed = _TECHNICAL_READING_SPEEDS
     else:
-        # General content: faster reading possible
-        fast_speed = 350    # Executive skimming
-        slow_speed = 200    # Thorough reading
+        fast_speed, slow_speed = _GENERAL_READING_SPEEDS
     
     # Calculate time range
     fast_minutes = word_count / fast_speed
     slow_minutes = word_count / slow_speed
     
-    # Helper function for time formatting
-    def format_time(minutes):
-        hours = int(minutes // 60)
-        mins = int(minutes % 60)
-        if hours > 0:
-            return f"{hours}h {mins}m"
-        else:
-            return f"{mins}m"
-    
-    fast_time = format_time(fast_minutes)
-    slow_time = format_time(slow_minutes)
-    
     # Provide context-aware range
     if abs(fast_minutes - slow_minutes) < 30:  # Less than 30 minute difference
         avg_minutes = (fast_minutes + slow_minutes) / 2
-        return f"~{format_time(avg_minutes)}"
+        return f"~{_format_minutes(avg_minutes)}"
+    else:
+        return f"{_format_minutes(fast_minutes)} - {_format_minutes(slow_minutes)}"
+
+
+def _format_minutes(minutes):
+    """Formats a number of minutes as "2h 30m", or just "45m" under an hour."""
+    # divmod() gives the quotient and remainder in one call
+    hours, mins = divmod(int(minutes), 60)
+    if hours > 0:
+        return f"{hours}h {mins}m"
     else:
-        return f"{fast_time} - {slow_time}"
+        return f"{mins}m"
 
 
 def detect_technical_content(text):
@@ -198,40 +467,23 @@ def detect_technical_content(text):
     Returns:
         bool: True if technical content detected, False otherwise
     """
-    # ENHANCED CONCEPT: Weighted technical indicators
-    technical_indicators = {
-        # High-weight: Very technical terms
-        'algorithm': 3, 'architecture': 3, 'scalability': 3, 'optimization': 3,
-        'implementation': 3, 'performance': 3, 'security': 3, 'protocol': 3,
-        
-        # Medium-weight: Programming and system terms  
-        'api': 2, 'framework': 2, 'library': 2, 'database': 2, 'server': 2,
-        'function': 2, 'method': 2, 'class': 2, 'object': 2, 'variable': 2,
-        'coding': 2, 'programming': 2, 'development': 2, 'software': 2,
-        
-        # Lower-weight: Common tech terms
-        'system': 1, 'network': 1, 'service': 1, 'platform': 1, 'application': 1
-    }
-    
-    # Programming languages (high weight)
-    programming_languages = [
-        'python', 'java', 'javascript', 'go', 'rust', 'sql', 'html', 'css'
-    ]
-    
-    text_lower = text.lower()
+    return _detect_technical_content(text.lower())
+
+
+def _detect_technical_content(text_lower):
+    """detect_technical_content() for text that is already lowercased."""
     score = 0
     
-    # Score based on weighted indicators
-    for term, weight in technical_indicators.items():
+    # Score based on weighted indicators and programming languages.
+    # Each "in" check scans the whole text, so stop once the score is high
+    # enough; checking heavy terms first gets there in fewer scans.
+    for weight, term in _WEIGHTED_TECHNICAL_TERMS:
         if term in text_lower:
             score += weight
+            if score >= 10:  # Enhanced threshold
+                return True
     
-    # Bonus for programming languages
-    for lang in programming_languages:
-        if lang in text_lower:
-            score += 3
-    
-    return score >= 10  # Enhanced threshold
+    return False
 
 
 def extract_key_concepts(text):
@@ -244,64 +496,32 @@ def extract_key_concepts(text):
     Returns:
         list: List of meaningful technical concepts, cleaned and deduplicated
     """
-    # Specific technical terms we want to find (curated list)
-    known_technical_terms = {
-        # System Design
-        'load balancer', 'microservice', 'monolith', 'api gateway', 'service mesh', 
-        'caching', 'sharding', 'replication', 'consistency', 'availability',
-        'cap theorem', 'horizontal scaling', 'vertical scaling',
-        
-        # Databases
-        'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch', 'dynamodb',
-        'cassandra', 'neo4j', 'rdbms', 'nosql', 'acid', 'sql',
-        
-        # Cloud & Infrastructure  
-        'aws', 'azure', 'gcp', 'kubernetes', 'docker', 'cloudfront', 'lambda',
-        'ec2', 's3', 'rds', 'vpc', 'cdn',
-        
-        # Programming & Frameworks
-        'python', 'java', 'javascript', 'typescript', 'go', 'rust',
-        'react', 'angular', 'vue', 'spring', 'django', 'flask', 'express',
-        
-        # Protocols & APIs
-        'http', 'https', 'tcp', 'udp', 'websocket', 'grpc', 'graphql', 
-        'rest', 'api', 'json', 'xml', 'oauth', 'jwt',
-        
-        # Architecture Patterns
-        'microservices', 'event driven', 'message queue', 'pub sub',
-        'circuit breaker', 'bulkhead', 'saga pattern'
-    }
-    
-    # Terms to absolutely exclude
-    exclusions = {
-        'afterword', 'chapter', 'section', 'figure', 'table', 'page',
-        'introduction', 'conclusion', 'summary', 'appendix', 'index',
-        'users', 'user', 'data', 'system', 'service', 'web', 'store', 'drive',
-        'file', 'time', 'way', 'example', 'problem', 'solution', 'method',
-        'information', 'result', 'process', 'work', 'team', 'company'
-    }
-    
-    text_lower = text.lower()
+    return list(_analyze(text).concepts)
+
+
+def _extract_key_concepts(text, text_lower):
+    """extract_key_concepts() given both the original and lowercased text."""
     found_concepts = []
     
     # 1. Find known technical terms (most reliable)
-    for term in known_technical_terms:
-        if term in text_lower:
-            # Count occurrences to gauge importance
-            count = text_lower.count(term)
-            if count >= 3:  # Must appear at least 3 times
-                # Normalize capitalization
-                if term.upper() in ['API', 'HTTP', 'HTTPS', 'TCP', 'UDP', 'SQL', 'JSON', 'XML', 'JWT', 'AWS', 'GCP', 'CDN', 'VPC', 'RDS', 'EC2', 'S3']:
-                    found_concepts.append((term.upper(), count))
-                elif term in ['nosql', 'grpc', 'graphql']:
-                    found_concepts.append((term.replace('nosql', 'NoSQL').replace('grpc', 'gRPC').replace('graphql', 'GraphQL'), count))
-                else:
-                    found_concepts.append((term.title(), count))
+    for term in _KNOWN_TECHNICAL_TERMS:
+        # Count occurrences to gauge importance. count() is a single scan;
+        # checking "term in text_lower" first would scan matching terms twice.
+        count = text_lower.count(term)
+        if count >= 3:  # Must appear at least 3 times
+            # Normalize capitalization
+            if term in _ACRONYM_TERMS:
+                found_concepts.append((term.upper(), count))
+            elif term in _MIXED_CASE_TERMS:
+                found_concepts.append((_MIXED_CASE_TERMS[term], count))
+            else:
+                found_concepts.append((term.title(), count))
     
     # 2. Find technology/product names (CamelCase, specific patterns)
-    tech_names = re.findall(r'\b(?:MongoDB|PostgreSQL|MySQL|Redis|Elasticsearch|DynamoDB|Cassandra|Neo4j|CloudFront|WebSocket|JavaScript|TypeScript|Node\.js|Next\.js|Spring Boot|React Native)\b', text)
-    for name in tech_names:
-        count = text.count(name)
+    # Counter tallies the matches from the single regex scan, so there is
+    # no need to re-scan the whole text with text.count() for every match
+    tech_names = Counter(_TECH_NAME_RE.findall(text))
+    for name, count in tech_names.items():
         if count >= 2:
             found_concepts.append((name, count))
     
@@ -309,19 +529,26 @@ def extract_key_concepts(text):
     # Group similar terms and keep the best version
     concept_groups = {}
     for concept, count in found_concepts:
-        key = concept.lower().replace(' ', '').replace('.', '').replace('-', '')
-        if key not in concept_groups or count > concept_groups[key][1]:
+        key = concept.lower().translate(_KEY_TRANS)
+        best = concept_groups.get(key)  # One lookup instead of "in" + [key]
+        if best is None or count > best[1]:
             concept_groups[key] = (concept, count)
     
     # Sort by frequency and relevance
     final_concepts = []
     for concept, count in concept_groups.values():
-        if concept.lower() not in exclusions and len(concept) >= 3:
+        if concept.lower() not in _CONCEPT_EXCLUSIONS and len(concept) >= 3:
             final_concepts.append((concept, count))
     
-    # Sort by count (descending) and return top 10
-    final_concepts.sort(key=lambda x: x[1], reverse=True)
-    return [concept for concept, _ in final_concepts[:10]]
+    # Take the top 10 by count (descending). For a big candidate pool,
+    # heapq.nlargest only keeps a 10-item heap instead of sorting everything;
+    # for a handful of candidates a plain sort is just as fast.
+    if len(final_concepts) > 30:
+        top_concepts = heapq.nlargest(10, final_concepts, key=itemgetter(1))
+    else:
+        final_concepts.sort(key=itemgetter(1), reverse=True)
+        top_concepts = final_concepts[:10]
+    return [concept for concept, _ in top_concepts]
 
 
 def generate_executive_summary(text):
@@ -348,15 +575,20 @@ def generate_executive_summary(text):
     Returns:
         list: List of actionable executive insights (max 6)
     """
+    return _summarize(_analyze(text))
+
+
+def _summarize(analysis):
+    """generate_executive_summary() for an already computed _analyze() result."""
     # BEGINNER CONCEPT: Building a list incrementally
     # We'll add insights one by one based on our analysis
     insights = []
     
     # BEGINNER CONCEPT: Gathering data for decision making
-    # Call our other functions to get the information we need
-    word_count = get_num_words(text)
-    is_technical = detect_technical_content(text)
-    concepts = extract_key_concepts(text)
+    # _analyze() scanned the text once for everything we need
+    word_count = analysis.word_count
+    is_technical = analysis.is_technical
+    concepts = analysis.concepts
     
     # BEGINNER CONCEPT: Conditional logic for classification
     # Based on technical content detection, give appropriate advice
@@ -387,18 +619,119 @@ def generate_executive_summary(text):
     elif len(concepts) > 5:
         insights.append("Focused on specific technology stack")
     
-    # BEGINNER CONCEPT: String searching with any() function
-    # any() returns True if ANY of the conditions are true
+    # BEGINNER CONCEPT: Boolean flags computed during analysis
     # This checks if the text contains practical, hands-on content
-    if any(term in text.lower() for term in ['example', 'tutorial', 'how to', 'step by step']):
+    if analysis.has_examples:
         insights.append("Contains practical examples - schedule hands-on practice time")
     
     # BEGINNER CONCEPT: Detecting best practices and architectural content
     # This helps executives know if the book will help with strategic planning
-    if any(term in text.lower() for term in ['best practice', 'pattern', 'architecture']):
+    if analysis.has_best_practices:
         insights.append("Includes best practices - extract actionable guidelines")
     
     # BEGINNER CONCEPT: List slicing to limit output
     # [:6] takes only the first 6 insights to avoid overwhelming the reader
     # This keeps the summary concise and actionable
     return insights[:6]  # Return top 6 insights
+
+
+def analyze_text(text):
+    """
+    Performs comprehensive analysis of text for executive insights.
+    
+    Args:
+        text (str): The text content to analyze
+        
+    Returns:
+        dict: Dictionary containing all analysis results
+    """
+    results = {}
+    
+    # Every result below is built from this single scan of the text
+    analysis = _analyze(text)
+    
+    # Basic metrics and character analysis
+    results['word_count'] = analysis.word_count
+    results['reading_time'] = _reading_time(analysis.word_count, analysis.is_technical)
+    results['char_analysis'] = list(analysis.top_letters)
+    
+    # Executive insights
+    results['key_concepts'] = list(analysis.concepts)
+    results['executive_summary'] = _summarize(analysis)
+    
+    return results
+
+
+def analyze_many(texts, workers=None):
+    """
+    Runs analyze_text() on several texts, in parallel when it pays off.
+    
+    Every analysis is pure CPU work on its own text, so each one can run in a
+    separate worker process (threads would all wait on the GIL). Starting
+    workers and sending them the texts has a fixed cost, though, so a couple
+    of texts, a small total amount of text, or a single worker are analyzed
+    right here in this process instead.
+    
+    Args:
+        texts (list): The texts to analyze
+        workers (int, optional): Most worker processes to use
+                                 (default: one per CPU)
+        
+    Returns:
+        list: One analyze_text() results dict per text, in the same order
+    """
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(texts))
+    if (workers < 2
+            or len(texts) < _PARALLEL_MIN_TEXTS
+            or sum(map(len, texts)) < _PARALLEL_MIN_CHARS):
+        return [analyze_text(text) for text in texts]
+    
+    # Send texts to the workers in batches, so a library of many short
+    # documents doesn't pay one round-trip per document; a few batches per
+    # worker still keeps the load balanced when text sizes differ
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze_text, texts, chunksize=chunksize))
+
+
+# Everything the executive functions need to know about a text
+_TextAnalysis = namedtuple(
+    '_TextAnalysis',
+    'word_count top_letters is_technical concepts has_examples has_best_practices',
+)
+
+
+@_memoize_by_text
+def _analyze(text):
+    """
+    Scans a text once for everything analyze_text() reports.
+    
+    Words and letters are counted together by count_words_and_letters(), and
+    the text is lowercased a single time and that copy is shared by every
+    check, instead of each function (and each any() check) lowercasing the
+    whole book again. Only the small results are kept, so memoizing them
+    costs little memory.
+    
+    Args:
+        text (str): The text to analyze
+        
+    Returns:
+        _TextAnalysis: word count, the top 10 (letter, count) pairs (most
+                       frequent first), technical flag, key concepts (as a
+                       tuple) and the two content flags used by the summary
+    """
+    word_count, chars_dict = count_words_and_letters(text)
+    text_lower = text.lower()
+    return _TextAnalysis(
+        word_count=word_count,
+        # Only the 10 most frequent letters are reported
+        top_letters=tuple(chars_dict_to_sorted_pairs(chars_dict, limit=10)),
+        is_technical=_detect_technical_content(text_lower),
+        concepts=tuple(_extract_key_concepts(text, text_lower)),
+        # any() returns True if ANY of the conditions are true
+        has_examples=any(term in text_lower for term in _EXAMPLE_PHRASES),
+        has_best_practices=any(term in text_lower for term in _BEST_PRACTICE_PHRASES),
+    )